@@ -0,0 +1,233 @@
+# Unit-IV Structured Query Language (Async): DML and view queries on an asyncio engine, with a sync vs async load test.
+
+# pip install "sqlalchemy[asyncio]>=1.4" aiosqlite
+
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+import StructuredQueryLanguage as sync_sql
+from StructuredQueryLanguage import Base, Department, Student
+
+# -----------------------------
+# Async Engine and Bounded Pool
+# -----------------------------
+POOL_SIZE = 8
+
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///sql_unit.db",
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=0,
+    pool_timeout=30,
+)
+# One AsyncSession per task; never share a session between concurrent coroutines
+AsyncSessionLocal = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+# -----------------------------
+# DDL
+# -----------------------------
+
+async def initialize_database_async():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Department))
+        if not result.scalars().first():
+            d1 = Department(name='Computer Science')
+            d2 = Department(name='Electrical Engineering')
+            session.add_all([d1, d2])
+
+            s1 = Student(roll_no=101, name="Alice", department=d1)
+            s2 = Student(roll_no=102, name="Bob", department=d1)
+            s3 = Student(roll_no=103, name="Charlie", department=d2)
+
+            session.add_all([s1, s2, s3])
+            await session.commit()
+
+async def create_view_async():
+    async with async_engine.begin() as conn:
+        await conn.execute(text("""
+        CREATE VIEW IF NOT EXISTS student_view AS
+        SELECT s.name AS student_name, d.name AS department_name
+        FROM students s
+        JOIN departments d ON s.dept_id = d.dept_id;
+        """))
+        print("View `student_view` created successfully.")
+
+# -----------------------------
+# DML: Data Manipulation Language
+# -----------------------------
+
+# Insert data
+async def insert_student_async(roll_no, name, dept_name):
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Department).filter_by(name=dept_name))
+        dept = result.scalars().first()
+        if dept:
+            session.add(Student(roll_no=roll_no, name=name, dept_id=dept.dept_id))
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                print(f"Student with roll_no {roll_no} already exists.")
+                return
+            print(f"Inserted student: {name}")
+        else:
+            print(f"Department {dept_name} does not exist.")
+
+# Update data (Change student name)
+async def update_student_name_async(roll_no, new_name):
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Student).filter_by(roll_no=roll_no))
+        student = result.scalars().first()
+        if student:
+            student.name = new_name
+            await session.commit()
+            print(f"Updated student name to: {new_name}")
+        else:
+            print(f"Student with roll_no {roll_no} not found.")
+
+# Delete data (Delete student)
+async def delete_student_async(roll_no):
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Student).filter_by(roll_no=roll_no))
+        student = result.scalars().first()
+        if student:
+            await session.delete(student)
+            await session.commit()
+            print(f"Deleted student with roll_no {roll_no}")
+        else:
+            print(f"Student with roll_no {roll_no} not found.")
+
+# Query data from view
+async def query_view_async():
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(text("SELECT * FROM student_view"))
+        rows = result.all()
+    print("\nQuerying data from `student_view`:")
+    for row in rows:
+        print(row)
+    return rows
+
+# -----------------------------
+# Load Test: Sync vs Async
+# -----------------------------
+CONCURRENCY_LEVELS = (1, 8, 32, 128)
+REQUESTS_PER_LEVEL = 2000
+
+def _sync_query_view():
+    # Same query as query_view(), on a per-call connection so it is thread-safe
+    with sync_sql.engine.connect() as conn:
+        return conn.execute(text("SELECT * FROM student_view")).all()
+
+async def _async_query_view():
+    # Same work as _sync_query_view(): one SELECT on a pooled connection, no ORM session, no printing
+    async with async_engine.connect() as conn:
+        result = await conn.execute(text("SELECT * FROM student_view"))
+        return result.all()
+
+async def _monitor_loop_lag(lags, stop, interval=0.01):
+    # How late the event loop wakes a sleeping task; high lag means something is blocking it
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+async def _run_level(request, concurrency, requests_per_client):
+    latencies = []
+
+    async def client():
+        # The timer starts when the client issues the request, so queueing for a
+        # thread or a pooled connection is part of the measured latency
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - start)
+
+    lags, stop = [], asyncio.Event()
+    monitor = asyncio.ensure_future(_monitor_loop_lag(lags, stop))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+
+    cut_points = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": cut_points[49] * 1000,
+        "p99_ms": cut_points[98] * 1000,
+        "max_lag_ms": max(lags, default=0.0) * 1000,
+    }
+
+async def load_test(concurrency_levels=CONCURRENCY_LEVELS, total_requests=REQUESTS_PER_LEVEL):
+    """Closed-loop load test: `concurrency` clients issue requests back to back.
+
+    The sync path runs on a thread pool the size of the async connection pool, so both
+    paths get the same amount of real concurrency.
+    """
+    sync_sql.engine.echo = False
+    await initialize_database_async()
+    await create_view_async()
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=POOL_SIZE)
+
+    async def sync_request():
+        await loop.run_in_executor(executor, _sync_query_view)
+
+    results = []
+    try:
+        for concurrency in concurrency_levels:
+            requests_per_client = max(total_requests // concurrency, 2)
+            for mode, request in (("sync", sync_request), ("async", _async_query_view)):
+                stats = await _run_level(request, concurrency, requests_per_client)
+                results.append((mode, concurrency, stats))
+    finally:
+        executor.shutdown()
+
+    print(f"\n{'mode':<6} {'concurrency':>11} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'max lag ms':>11}")
+    for mode, concurrency, stats in results:
+        print(f"{mode:<6} {concurrency:>11} {stats['rps']:>10.1f} {stats['p50_ms']:>8.2f} "
+              f"{stats['p99_ms']:>8.2f} {stats['max_lag_ms']:>11.2f}")
+    return results
+
+# -----------------------------
+# Running the Code
+# -----------------------------
+async def main():
+    try:
+        await initialize_database_async()
+
+        # DML: Insert, update and delete concurrently, each in its own session
+        await asyncio.gather(
+            insert_student_async(roll_no=104, name="David", dept_name="Electrical Engineering"),
+            insert_student_async(roll_no=105, name="Eve", dept_name="Computer Science"),
+        )
+        await update_student_name_async(roll_no=104, new_name="David Smith")
+        await delete_student_async(roll_no=105)
+
+        # Create and query view
+        await create_view_async()
+        await query_view_async()
+
+        # Compare the sync and async paths under increasing concurrency
+        await load_test()
+    finally:
+        # Stops aiosqlite's worker threads so the interpreter can exit after an error
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,226 @@
+# Columnar Analytics: Core cursor export into NumPy column arrays, vectorized group-by, count and sum.
+
+from operator import itemgetter
+
+import numpy as np
+from sqlalchemy import create_engine, select, func, Table, MetaData, Column, String, Float, Boolean
+from sqlalchemy.exc import OperationalError
+
+import RelationalModel
+import DatabaseDesign
+import TransactionManagement
+from RelationalModel import engine as relational_engine, Student
+from DatabaseDesign import engine as design_engine, Course, enrollments
+from TransactionManagement import engine as transaction_engine, Account
+
+# Rows fetched from the cursor per partition
+CHUNK_SIZE = 100_000
+
+# -----------------------------
+# Column Type Mapping
+# -----------------------------
+
+def _numpy_dtype(sql_type):
+    try:
+        python_type = sql_type.python_type
+    except NotImplementedError:
+        return np.dtype(object)
+
+    if python_type is bool:
+        return np.dtype(np.bool_)
+    if python_type is int:
+        return np.dtype(np.int64)
+    if python_type is float:
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+def _to_array(rows, index, dtype):
+    # Build one column straight from the fetched tuples; NULLs become a mask, as in np.ma
+    count = len(rows)
+    getter = itemgetter(index)
+
+    if dtype.kind == "O":
+        data = np.empty(count, dtype=object)
+        data[:] = list(map(getter, rows))
+        mask = np.equal(data, None)
+        return np.ma.MaskedArray(data, mask=mask) if mask.any() else np.ma.MaskedArray(data)
+
+    # Scan for NULLs first: fromiter would silently coerce None to nan (float) or False (bool)
+    values = list(map(getter, rows))
+    if None not in values:
+        return np.ma.MaskedArray(np.fromiter(values, dtype=dtype, count=count))
+
+    fill = False if dtype.kind == "b" else 0
+    mask = np.fromiter((v is None for v in values), dtype=np.bool_, count=count)
+    data = np.fromiter((fill if v is None else v for v in values), dtype=dtype, count=count)
+    return np.ma.MaskedArray(data, mask=mask)
+
+# -----------------------------
+# Chunked Export from a Core Cursor
+# -----------------------------
+
+def iter_column_chunks(bind, stmt, chunk_size=CHUNK_SIZE):
+    """Yield one {column_name: MaskedArray} dict per chunk of rows; NULLs are masked.
+
+    An empty result still yields one empty chunk, so consumers always see the column dtypes.
+    The statement is compiled once and streamed from the raw DBAPI cursor with
+    fetchmany(), so neither ORM objects nor SQLAlchemy Row objects are created.
+    """
+    names = [col.name for col in stmt.selected_columns]
+    dtypes = [_numpy_dtype(col.type) for col in stmt.selected_columns]
+
+    compiled = stmt.compile(dialect=bind.dialect, compile_kwargs={"render_postcompile": True})
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+
+    raw_conn = bind.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        try:
+            cursor.execute(str(compiled), params)
+            rows = cursor.fetchmany(chunk_size)
+            yield {name: _to_array(rows, i, dtype) for i, (name, dtype) in enumerate(zip(names, dtypes))}
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield {name: _to_array(rows, i, dtype) for i, (name, dtype) in enumerate(zip(names, dtypes))}
+        finally:
+            cursor.close()
+    finally:
+        raw_conn.close()
+
+def export_columns(bind, stmt, chunk_size=CHUNK_SIZE):
+    """Export the full result of a table or join as a {column_name: MaskedArray} dict."""
+    chunks = list(iter_column_chunks(bind, stmt, chunk_size))
+    return {name: np.ma.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+# -----------------------------
+# Vectorized Aggregates
+# -----------------------------
+
+def _non_null(*columns):
+    # Drop every row where any of the columns is NULL, as SQL does for GROUP BY keys and SUM
+    masks = [np.ma.getmask(col) for col in columns]
+    data = [np.ma.getdata(col) for col in columns]
+    masks = [mask for mask in masks if mask is not np.ma.nomask]
+    if not masks:
+        return data
+    keep = ~np.logical_or.reduce(masks)
+    return [values[keep] for values in data]
+
+def group_count(keys):
+    """COUNT(*) ... GROUP BY keys, skipping NULL keys. Returns (unique_keys, counts)."""
+    keys, = _non_null(keys)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    return unique_keys, np.bincount(inverse, minlength=len(unique_keys))
+
+def group_sum(keys, values):
+    """SUM(values) ... GROUP BY keys, skipping NULLs. Returns (unique_keys, sums) in the dtype of values."""
+    keys, values = _non_null(keys, values)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    sums = np.zeros(len(unique_keys), dtype=np.result_type(values.dtype, np.int64))
+    np.add.at(sums, inverse, values)
+    return unique_keys, sums
+
+def aggregate_chunks(chunks, key, value=None):
+    """Streaming GROUP BY over iter_column_chunks(); counts when value is None, else sums.
+
+    Only per-chunk partial results are kept, so memory stays bounded by the chunk size
+    and the number of distinct keys. An empty table gives empty results in the key
+    column's dtype, since iter_column_chunks() always yields at least one chunk.
+    """
+    partial_keys, partial_totals = [], []
+    for chunk in chunks:
+        if value is None:
+            keys, totals = group_count(chunk[key])
+        else:
+            keys, totals = group_sum(chunk[key], chunk[value])
+        partial_keys.append(keys)
+        partial_totals.append(totals)
+
+    return group_sum(np.concatenate(partial_keys), np.concatenate(partial_totals))
+
+# -----------------------------
+# Analytics over Students, Enrollments and Accounts
+# -----------------------------
+
+def students_per_department():
+    stmt = select(Student.__table__.c.dept_id)
+    return aggregate_chunks(iter_column_chunks(relational_engine, stmt), "dept_id")
+
+def enrollments_per_course():
+    """Returns (course_ids, course_names, counts); grouped by courses.id since names are not unique."""
+    course_ids, counts = aggregate_chunks(
+        iter_column_chunks(design_engine, select(enrollments.c.course_id)), "course_id"
+    )
+    with design_engine.connect() as conn:
+        names = dict(conn.execute(select(Course.__table__.c.id, Course.__table__.c.name)).all())
+    course_names = np.array([names.get(course_id) for course_id in course_ids.tolist()], dtype=object)
+    return course_ids, course_names, counts
+
+def balance_distribution(bins=10):
+    """Histogram of Account.balance over fixed edges, accumulated chunk by chunk."""
+    balance = Account.__table__.c.balance
+    with transaction_engine.connect() as conn:
+        low, high = conn.execute(select(func.min(balance), func.max(balance))).one()
+
+    counts = np.zeros(bins, dtype=np.int64)
+    if low is None:
+        return counts, np.zeros(bins + 1)
+    edges = np.linspace(low, high, bins + 1) if low != high else np.linspace(low - 0.5, high + 0.5, bins + 1)
+
+    accounts, total = 0, 0
+    for chunk in iter_column_chunks(transaction_engine, select(balance)):
+        balances, = _non_null(chunk["balance"])
+        counts += np.histogram(balances, bins=edges)[0]
+        accounts += len(balances)
+        total += balances.sum()
+
+    if accounts:
+        print(f"Accounts: {accounts}, total balance: {total}, mean balance: {total / accounts:.2f}")
+    return counts, edges
+
+# -----------------------------
+# Running the Code
+# -----------------------------
+if __name__ == "__main__":
+    # Each unit script owns its own database; make sure they exist with sample data
+    try:
+        RelationalModel.initialize_database()
+        DatabaseDesign.initialize_database()
+        TransactionManagement.initialize_database()
+    except OperationalError as e:
+        print(f"Could not initialize the unit databases: {e}")
+        raise SystemExit(1)
+
+    print("\n📊 Students per Department (dept_id -> count)")
+    for dept_id, count in zip(*students_per_department()):
+        print(f"{dept_id}: {count}")
+
+    print("\n📊 Enrollments per Course")
+    for course_id, course_name, count in zip(*enrollments_per_course()):
+        print(f"{course_name} (id {course_id}): {count}")
+
+    print("\n📊 NULL Handling (SUM and COUNT skip NULLs, as in SQL)")
+    null_engine = create_engine("sqlite://")
+    null_table = Table("readings", MetaData(),
+        Column("sensor", String), Column("value", Float), Column("active", Boolean))
+    null_table.metadata.create_all(null_engine)
+    with null_engine.begin() as conn:
+        conn.execute(null_table.insert(), [
+            {"sensor": "a", "value": 1.5, "active": True},
+            {"sensor": "a", "value": None, "active": None},
+            {"sensor": None, "value": 2.0, "active": False},
+        ])
+    chunk = next(iter_column_chunks(null_engine, select(null_table)))
+    print(f"value: {chunk['value']}, active: {chunk['active']}")
+    print(f"SUM(value) GROUP BY sensor: {dict(zip(*group_sum(chunk['sensor'], chunk['value'])))}")
+    print(f"COUNT(*) GROUP BY active: {dict(zip(*group_count(chunk['active'])))}")
+
+    print("\n📊 Balance Distribution over Accounts")
+    counts, edges = balance_distribution(bins=5)
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        print(f"[{low:.0f}, {high:.0f}): {count}")
@@ -0,0 +1,272 @@
+# Horizontal Partitioning: students and their enrollments sharded across N SQLite files, with scatter-gather queries.
+
+import heapq
+import os
+import threading
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+
+Base = declarative_base()
+
+# ----------------------------------------
+# Shard Schema
+# ----------------------------------------
+
+# Departments are small and replicated to every shard so department joins stay shard-local
+class Department(Base):
+    __tablename__ = 'departments'
+    dept_id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+    students = relationship("Student", back_populates="department")
+
+class Student(Base):
+    __tablename__ = 'students'
+    roll_no = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    dept_id = Column(Integer, ForeignKey('departments.dept_id'))
+
+    department = relationship("Department", back_populates="students")
+    enrollments = relationship("Enrollment", back_populates="student", cascade="all, delete-orphan")
+
+# Enrollments are co-located with their student
+class Enrollment(Base):
+    __tablename__ = 'enrollments'
+    roll_no = Column(Integer, ForeignKey('students.roll_no'), primary_key=True)
+    course_name = Column(String, primary_key=True)
+
+    student = relationship("Student", back_populates="enrollments")
+
+# ----------------------------------------
+# Scatter Worker (runs in a child process)
+# ----------------------------------------
+
+# One engine per shard URL, kept for the lifetime of each worker process
+_worker_engines = {}
+
+def _query_shard(url, sql, params):
+    shard_engine = _worker_engines.get(url)
+    if shard_engine is None:
+        shard_engine = _worker_engines[url] = create_engine(url)
+
+    # Raw DBAPI cursor: sqlite3 returns plain tuples (cheap to pickle back) and accepts :name params
+    raw_conn = shard_engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        try:
+            cursor.execute(sql, params or {})
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+    finally:
+        raw_conn.close()
+
+# ----------------------------------------
+# Partitioning Layer
+# ----------------------------------------
+
+class PartitionedStudentStore:
+    """Shards students by dept_id ("dept") or by a stable hash of roll_no ("hash")."""
+
+    def __init__(self, num_shards=4, strategy="hash", path_template="students_shard_{}.db", max_workers=None):
+        if strategy not in ("dept", "hash"):
+            raise ValueError(f"Unknown sharding strategy: {strategy}")
+
+        self.num_shards = num_shards
+        self.strategy = strategy
+        self.urls = [f"sqlite:///{path_template.format(i)}" for i in range(num_shards)]
+        self.engines = [create_engine(url, echo=False) for url in self.urls]
+        self.sessions = [sessionmaker(bind=shard_engine) for shard_engine in self.engines]
+        self.max_workers = max_workers or min(num_shards, os.cpu_count() or 1)
+        self._executor = None
+        self._write_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for shard_engine in self.engines:
+            shard_engine.dispose()
+
+    # -----------------------------
+    # Routing
+    # -----------------------------
+
+    def shard_for(self, roll_no=None, dept_id=None):
+        if self.strategy == "dept":
+            if dept_id is None:
+                raise ValueError("dept_id is required to route under the 'dept' strategy")
+            return dept_id % self.num_shards
+        if roll_no is None:
+            raise ValueError("roll_no is required to route under the 'hash' strategy")
+        return zlib.crc32(str(roll_no).encode()) % self.num_shards
+
+    def locate_student(self, roll_no, dept_id=None):
+        """Return the shard holding roll_no, fanning out only when the shard key is unknown."""
+        if self.strategy == "hash" or dept_id is not None:
+            return self.shard_for(roll_no=roll_no, dept_id=dept_id)
+        # A primary-key probe is far cheaper than a process-pool round trip, so loop in-process
+        for shard, shard_engine in enumerate(self.engines):
+            with shard_engine.connect() as conn:
+                found = conn.execute(
+                    text("SELECT 1 FROM students WHERE roll_no = :roll_no"), {"roll_no": roll_no}
+                ).first()
+            if found:
+                return shard
+        return None
+
+    # -----------------------------
+    # DDL and Writes
+    # -----------------------------
+
+    def initialize_database(self, departments):
+        """Create the schema on every shard and replicate the department table to each one."""
+        for shard_engine, Session in zip(self.engines, self.sessions):
+            Base.metadata.create_all(shard_engine)
+            with Session() as session:
+                for dept_id, name in departments:
+                    session.merge(Department(dept_id=dept_id, name=name))
+                session.commit()
+
+    def insert_student(self, roll_no, name, dept_id):
+        """Insert a student on its shard; returns the shard, or None for a duplicate roll_no.
+
+        Under the dept strategy a shard's primary key only guards one department, so
+        roll_no uniqueness is checked on every shard while holding a store-level lock.
+        That lock covers threads sharing this store; writes from several processes
+        under the dept strategy are not supported.
+        """
+        with self._write_lock:
+            if self.strategy == "dept" and self.locate_student(roll_no) is not None:
+                print(f"Student with roll_no {roll_no} already exists.")
+                return None
+
+            shard = self.shard_for(roll_no=roll_no, dept_id=dept_id)
+            with self.sessions[shard]() as session:
+                session.add(Student(roll_no=roll_no, name=name, dept_id=dept_id))
+                try:
+                    session.commit()
+                except IntegrityError:
+                    session.rollback()
+                    print(f"Student with roll_no {roll_no} already exists.")
+                    return None
+        return shard
+
+    def enroll(self, roll_no, course_name, dept_id=None):
+        shard = self.locate_student(roll_no, dept_id)
+        if shard is None:
+            print(f"Student with roll_no {roll_no} not found.")
+            return None
+        with self.sessions[shard]() as session:
+            # SQLite does not enforce the foreign key, so check the student is on this shard
+            if session.get(Student, roll_no) is None:
+                print(f"Student with roll_no {roll_no} not found.")
+                return None
+            session.add(Enrollment(roll_no=roll_no, course_name=course_name))
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                print(f"Student {roll_no} is already enrolled in {course_name}.")
+                return None
+        return shard
+
+    # -----------------------------
+    # Point Lookups (single shard)
+    # -----------------------------
+
+    def get_student(self, roll_no, dept_id=None):
+        shard = self.locate_student(roll_no, dept_id)
+        if shard is None:
+            return None
+        with self.engines[shard].connect() as conn:
+            return conn.execute(
+                text("SELECT roll_no, name, dept_id FROM students WHERE roll_no = :roll_no"),
+                {"roll_no": roll_no},
+            ).first()
+
+    # -----------------------------
+    # Scatter-Gather (all shards)
+    # -----------------------------
+
+    def scatter(self, sql, params=None):
+        """Run sql on every shard in parallel; returns one row list per shard."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        futures = [self._executor.submit(_query_shard, url, sql, params) for url in self.urls]
+        return [future.result() for future in futures]
+
+    def scatter_gather(self, sql, params=None, order_key=None):
+        """Fan sql out across shards and merge the rows.
+
+        When order_key is given, each shard's SQL must already be sorted by the same key
+        and the shard results are merged with a k-way merge instead of a full sort.
+        """
+        results = self.scatter(sql, params)
+        if order_key is not None:
+            return list(heapq.merge(*results, key=order_key))
+        return [row for rows in results for row in rows]
+
+    def department_join(self, limit=None):
+        """Student name with department name, as in relational_algebra_simulation().
+
+        With a limit, each shard returns at most `limit` sorted rows, so only
+        num_shards * limit rows cross the process boundary before the merge.
+        """
+        sql = """
+            SELECT s.name, d.name FROM students s
+            JOIN departments d ON s.dept_id = d.dept_id
+            ORDER BY s.name
+        """
+        if limit is None:
+            return self.scatter_gather(sql, order_key=lambda row: row[0])
+        rows = self.scatter_gather(sql + " LIMIT :limit", {"limit": limit}, order_key=lambda row: row[0])
+        return rows[:limit]
+
+    def students_per_department(self):
+        partials = self.scatter("""
+            SELECT d.name, COUNT(*) FROM students s
+            JOIN departments d ON s.dept_id = d.dept_id
+            GROUP BY d.name
+        """)
+        totals = Counter()
+        for rows in partials:
+            for dept_name, count in rows:
+                totals[dept_name] += count
+        return dict(totals)
+
+# -----------------------------
+# Run All Sections
+# -----------------------------
+if __name__ == "__main__":
+    with PartitionedStudentStore(num_shards=4, strategy="hash") as store:
+        store.initialize_database([(1, 'Computer Science'), (2, 'Physics')])
+
+        if store.get_student(101) is None:
+            for roll_no, name, dept_id in [(101, "Alice", 1), (102, "Bob", 1), (201, "Charlie", 2)]:
+                shard = store.insert_student(roll_no, name, dept_id)
+                print(f"Inserted {name} into shard {shard}")
+            store.enroll(101, "Algorithms")
+            store.enroll(201, "Quantum Mechanics")
+
+        print("\n🔍 Point Lookup: roll_no 102")
+        print(store.get_student(102))
+
+        print("\n🔍 Join: Student Name with Department Name (scatter-gather)")
+        for student_name, dept_name in store.department_join():
+            print(f"{student_name} - {dept_name}")
+
+        print("\n🔍 Aggregate: Students per Department (scatter-gather)")
+        for dept_name, count in store.students_per_department().items():
+            print(f"{dept_name}: {count}")